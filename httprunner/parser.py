@@ -466,7 +466,14 @@ def parse_variables_mapping(
     return parsed_variables
 
 
-def parse_parameters(parameters: Dict,) -> List[Dict]:
+parameters_sampling_mapping = {
+    "full": utils.gen_cartesian_product,
+    "pairwise": utils.gen_pairwise_product,
+    "each-value": utils.gen_each_value_product,
+}
+
+
+def parse_parameters(parameters: Dict, sampling: Text = "full") -> List[Dict]:
     """ parse parameters and generate cartesian product.
 
     Args:
@@ -475,6 +482,10 @@ def parse_parameters(parameters: Dict,) -> List[Dict]:
                 (1) data list, e.g. ["iOS/10.1", "iOS/10.2", "iOS/10.3"]
                 (2) call built-in parameterize function, "${parameterize(account.csv)}"
                 (3) call custom function in debugtalk.py, "${gen_app_version()}"
+        sampling (Text): how to combine parameters
+            "full": full cartesian product, default
+            "pairwise": each pair of values from any two parameters appears at least once
+            "each-value": each value of each parameter appears at least once
 
     Returns:
         list: cartesian product list
@@ -488,6 +499,14 @@ def parse_parameters(parameters: Dict,) -> List[Dict]:
         >>> parse_parameters(parameters)
 
     """
+    try:
+        gen_product = parameters_sampling_mapping[sampling]
+    except KeyError:
+        raise exceptions.ParamsError(
+            f"Invalid parameters sampling: {sampling}, "
+            f"should be one of {list(parameters_sampling_mapping.keys())}"
+        )
+
     parsed_parameters_list: List[List[Dict]] = []
 
     # load project_meta functions
@@ -570,4 +589,4 @@ def parse_parameters(parameters: Dict,) -> List[Dict]:
 
         parsed_parameters_list.append(parameter_content_list)
 
-    return utils.gen_cartesian_product(*parsed_parameters_list)
+    return gen_product(*parsed_parameters_list)
@@ -1,12 +1,12 @@
 import collections
-import copy
+import functools
 import json
 import os.path
 import platform
 import uuid
 from multiprocessing import Queue
 import itertools
-from typing import Dict, List, Any, Union, Text
+from typing import Dict, List, Any, Union, Text, Iterator, Callable
 
 import sentry_sdk
 from loguru import logger
@@ -16,21 +16,27 @@ from httprunner import exceptions
 from httprunner.models import VariablesMapping
 
 
+@functools.lru_cache(maxsize=1)
+def _get_node_id() -> int:
+    return uuid.getnode()
+
+
 def init_sentry_sdk():
     sentry_sdk.init(
         dsn="https://460e31339bcb428c879aafa6a2e78098@sentry.io/5263855",
         release="httprunner@{}".format(__version__),
     )
     with sentry_sdk.configure_scope() as scope:
-        scope.set_user({"id": uuid.getnode()})
+        scope.set_user({"id": _get_node_id()})
 
 
 def set_os_environ(variables_mapping):
     """ set variables mapping to os.environ
     """
-    for variable in variables_mapping:
-        os.environ[variable] = variables_mapping[variable]
-        logger.debug(f"Set OS environment variable: {variable}")
+    os.environ.update(variables_mapping)
+    logger.opt(lazy=True).debug(
+        "Set OS environment variables: {}", lambda: list(variables_mapping)
+    )
 
 
 def unset_os_environ(variables_mapping):
@@ -38,7 +44,7 @@ def unset_os_environ(variables_mapping):
     """
     for variable in variables_mapping:
         os.environ.pop(variable)
-        logger.debug(f"Unset OS environment variable: {variable}")
+        logger.debug("Unset OS environment variable: {}", variable)
 
 
 def get_os_environ(variable_name):
@@ -92,7 +98,14 @@ def lower_dict_keys(origin_dict):
     if not origin_dict or not isinstance(origin_dict, dict):
         return origin_dict
 
-    return {key.lower(): value for key, value in origin_dict.items()}
+    if all(isinstance(key, str) and key.islower() for key in origin_dict):
+        # keys are already lowered, avoid building a new dict
+        return origin_dict
+
+    return {
+        key.lower() if isinstance(key, str) else key: value
+        for key, value in origin_dict.items()
+    }
 
 
 def print_info(info_mapping):
@@ -121,10 +134,12 @@ def print_info(info_mapping):
     if not info_mapping:
         return
 
-    content_format = "{:<16} : {:<}\n"
-    content = "\n==================== Output ====================\n"
-    content += content_format.format("Variable", "Value")
-    content += content_format.format("-" * 16, "-" * 29)
+    format_content = "{:<16} : {:<}\n".format
+    content_parts = [
+        "\n==================== Output ====================\n",
+        format_content("Variable", "Value"),
+        format_content("-" * 16, "-" * 29),
+    ]
 
     for key, value in info_mapping.items():
         if isinstance(value, (tuple, collections.deque)):
@@ -134,10 +149,14 @@ def print_info(info_mapping):
         elif value is None:
             value = "None"
 
-        content += content_format.format(key, value)
+        content_parts.append(format_content(key, value))
+
+    content_parts.append("-" * 48 + "\n")
+    logger.info("".join(content_parts))
 
-    content += "-" * 48 + "\n"
-    logger.info(content)
+
+_OMITTED_APPENDIX_STR = " ... OMITTED %d CHARACTERS ..."
+_OMITTED_APPENDIX_BYTES = _OMITTED_APPENDIX_STR.encode("utf-8")
 
 
 def omit_long_data(body, omit_len=512):
@@ -150,16 +169,15 @@ def omit_long_data(body, omit_len=512):
     if body_len <= omit_len:
         return body
 
-    omitted_body = body[0:omit_len]
-
-    appendix_str = f" ... OMITTED {body_len - omit_len} CHARACTORS ..."
     if isinstance(body, bytes):
-        appendix_str = appendix_str.encode("utf-8")
+        appendix = _OMITTED_APPENDIX_BYTES % (body_len - omit_len,)
+        return b"".join((body[:omit_len], appendix))
 
-    return omitted_body + appendix_str
+    return body[:omit_len] + _OMITTED_APPENDIX_STR % (body_len - omit_len,)
 
 
-def get_platform():
+@functools.lru_cache(maxsize=1)
+def _get_platform_info() -> Dict:
     return {
         "httprunner_version": __version__,
         "python_version": "{} {}".format(
@@ -169,24 +187,35 @@ def get_platform():
     }
 
 
+def get_platform():
+    """ get platform info, which is only computed once in the process
+    """
+    # return a new dict on each call, so the cached info can not be mutated by callers
+    return dict(_get_platform_info())
+
+
 def sort_dict_by_custom_order(raw_dict: Dict, custom_order: List):
-    def get_index_from_list(lst: List, item: Any):
-        try:
-            return lst.index(item)
-        except ValueError:
-            # item is not in lst
-            return len(lst) + 1
+    order_index = {item: index for index, item in enumerate(custom_order)}
+    # items not in custom_order are put at the end
+    missing_index = len(custom_order) + 1
 
     return dict(
-        sorted(raw_dict.items(), key=lambda i: get_index_from_list(custom_order, i[0]))
+        sorted(raw_dict.items(), key=lambda i: order_index.get(i[0], missing_index))
     )
 
 
+# common types known to be unserializable by json, dumped with repr directly
+_JSON_UNSERIALIZABLE_TYPES = (bytes, bytearray)
+
+
 class ExtendJSONEncoder(json.JSONEncoder):
     """ especially used to safely dump json data with python object, such as MultipartEncoder
     """
 
     def default(self, obj):
+        if isinstance(obj, _JSON_UNSERIALIZABLE_TYPES):
+            return repr(obj)
+
         try:
             return super(ExtendJSONEncoder, self).default(obj)
         except (UnicodeDecodeError, TypeError):
@@ -198,20 +227,21 @@ def merge_variables(
 ) -> VariablesMapping:
     """ merge two variables mapping, the first variables have higher priority
     """
-    step_new_variables = {}
+    merged_variables = dict(variables_to_be_overridden)
     for key, value in variables.items():
-        if f"${key}" == value or "${" + key + "}" == value:
+        if isinstance(value, str) and (
+            f"${key}" == value or "${" + key + "}" == value
+        ):
             # e.g. {"base_url": "$base_url"}
             # or {"base_url": "${base_url}"}
             continue
 
-        step_new_variables[key] = value
+        merged_variables[key] = value
 
-    merged_variables = copy.copy(variables_to_be_overridden)
-    merged_variables.update(step_new_variables)
     return merged_variables
 
 
+@functools.lru_cache(maxsize=1)
 def is_support_multiprocessing() -> bool:
     try:
         Queue()
@@ -221,6 +251,38 @@ def is_support_multiprocessing() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=None)
+def _get_dicts_merger(dicts_count: int) -> Callable:
+    """ generate function to merge fixed count of dicts with one dict display,
+        e.g. lambda d0, d1: {**d0, **d1}, latter dicts have higher priority.
+    """
+    arg_names = [f"d{index}" for index in range(dicts_count)]
+    merger_source = "lambda {}: {{{}}}".format(
+        ", ".join(arg_names), ", ".join(f"**{name}" for name in arg_names)
+    )
+    return eval(merger_source)
+
+
+def gen_cartesian_product_iter(*args: List[Dict]) -> Iterator[Dict]:
+    """ lazily generate cartesian product for lists, yield one merged dict at a time
+
+    Args:
+        args (list of list): lists to be generated with cartesian product
+
+    Yields:
+        dict: merged mapping of one cartesian product item
+
+    """
+    if not args:
+        return
+    elif len(args) == 1:
+        yield from args[0]
+        return
+
+    merge_dicts = _get_dicts_merger(len(args))
+    yield from itertools.starmap(merge_dicts, itertools.product(*args))
+
+
 def gen_cartesian_product(*args: List[Dict]) -> List[Dict]:
     """ generate cartesian product for lists
 
@@ -245,137 +307,298 @@ def gen_cartesian_product(*args: List[Dict]) -> List[Dict]:
                 {'a': 2, 'x': 121, 'y': 122}
             ]
 
+    """
+    if len(args) == 1:
+        return args[0]
+
+    return list(gen_cartesian_product_iter(*args))
+
+
+def gen_each_value_product(*args: List[Dict]) -> List[Dict]:
+    """ generate combinations for lists, each item of each list appears at least once.
+
+    The number of combinations equals to the length of the longest list,
+    shorter lists are cycled to fill up.
+
+    Examples:
+
+        >>> arg1 = [{"a": 1}, {"a": 2}]
+        >>> arg2 = [{"x": 111}, {"x": 121}, {"x": 131}]
+        >>> gen_each_value_product(arg1, arg2)
+            [
+                {'a': 1, 'x': 111},
+                {'a': 2, 'x': 121},
+                {'a': 1, 'x': 131}
+            ]
+
     """
     if not args:
         return []
     elif len(args) == 1:
         return args[0]
+    elif not all(args):
+        return []
 
-    product_list = []
-    for product_item_tuple in itertools.product(*args):
-        product_item_dict = {}
-        for item in product_item_tuple:
-            product_item_dict.update(item)
+    product_count = max(len(arg) for arg in args)
+    return [
+        dict(
+            itertools.chain.from_iterable(
+                arg[index % len(arg)].items() for arg in args
+            )
+        )
+        for index in range(product_count)
+    ]
+
+
+def gen_pairwise_product(*args: List[Dict]) -> List[Dict]:
+    """ generate combinations for lists, each pair of items from any two lists appears
+        at least once, which is usually much less than the full cartesian product.
 
-        product_list.append(product_item_dict)
+    Combinations are built greedily: each one starts from an uncovered pair,
+    then picks the item covering most uncovered pairs for every other list.
+
+    """
+    if len(args) <= 2:
+        return gen_cartesian_product(*args)
+    elif not all(args):
+        return []
+
+    args_count = len(args)
+    uncovered_pairs = {
+        ((i, a), (j, b))
+        for i, j in itertools.combinations(range(args_count), 2)
+        for a in range(len(args[i]))
+        for b in range(len(args[j]))
+    }
+
+    def get_pair(i, a, j, b):
+        return ((i, a), (j, b)) if i < j else ((j, b), (i, a))
+
+    product_list = []
+    while uncovered_pairs:
+        (i, a), (j, b) = min(uncovered_pairs)
+        selected = {i: a, j: b}
+        for k in range(args_count):
+            if k in selected:
+                continue
+
+            selected[k] = max(
+                range(len(args[k])),
+                key=lambda c: sum(
+                    get_pair(k, c, m, selected[m]) in uncovered_pairs
+                    for m in selected
+                ),
+            )
+
+        for m, n in itertools.combinations(range(args_count), 2):
+            uncovered_pairs.discard(((m, selected[m]), (n, selected[n])))
+
+        product_list.append(
+            dict(
+                itertools.chain.from_iterable(
+                    args[k][selected[k]].items() for k in range(args_count)
+                )
+            )
+        )
 
     return product_list
 
 
-def filter_dict(data: Dict, filter_condition='@null@') -> Dict:
-	if data is None:
-		return data
-
-	if not isinstance(filter_condition, str) or not isinstance(data, dict):
-		raise TypeError('filter_condition must str and data will be dict for the method filter_dict')
-	result_data = {}
-	for key, value in data.items():
-		if isinstance(value, (int, float, complex, bool)):
-			result_data[key] = value
-		elif isinstance(value, str):
-			value = value.strip().lower()
-			if value == filter_condition:
-				continue
-			else:
-				result_data[key] = value
-		elif isinstance(value, dict):
-			result_data[key] = filter_dict(value, filter_condition=filter_condition)
-		elif isinstance(value, list):
-			result_data[key] = filter_list(value, filter_condition=filter_condition)
-		elif isinstance(value, set):
-			result_data[key] = filter_set(value, filter_condition=filter_condition)
-		elif isinstance(value, tuple):
-			result_data[key] = filter_tuple(value, filter_condition=filter_condition)
-		elif value is None:
-			result_data[key] = value
-		else:
-			raise TypeError("error for type {}".format(value))
-	return result_data
-
-
-def filter_list(data: list, filter_condition='@null@') -> list:
-	if data is None:
-		return data
-	result_data = []
-
-	if not isinstance(filter_condition, str) or not isinstance(data, list):
-		raise TypeError('filter_condition must str and data will be list for the method filter_list')
-
-	for element in data:
-		if isinstance(element, (int, float, complex, bool)):
-			result_data.append(element)
-		elif isinstance(element, str):
-			element = element.strip().lower()
-			if element == filter_condition:
-				continue
-			else:
-				result_data.append(element)
-		elif isinstance(element, dict):
-			result_data.append(filter_dict(element, filter_condition=filter_condition))
-		elif isinstance(element, list):
-			result_data.extend(filter_list(element, filter_condition=filter_condition))
-		elif isinstance(element, tuple):
-			result_data.append(filter_tuple(element, filter_condition=filter_condition))
-		elif isinstance(element, set):
-			result_data.append(filter_set(element, filter_condition=filter_condition))
-		elif element is None:
-			result_data.append(element)
-		else:
-			raise TypeError("no this type {}".format(element))
-	return result_data
+_FILTERED = object()
+_PRIMITIVE_TYPES = (int, float, complex, bool)
+_NUMERIC_TYPES = frozenset(_PRIMITIVE_TYPES)
+# leaf types kept as is by the filter
+_PASSTHROUGH_TYPES = frozenset(_PRIMITIVE_TYPES + (type(None),))
+
+
+def _filter_leaf(value, filter_condition):
+    return value
+
+
+def _filter_str(value, filter_condition):
+    value = value.strip().lower()
+    if value == filter_condition:
+        return _FILTERED
+    return value
+
+
+def _open_dict(data, filter_condition):
+    return iter(data.items()), {}
+
+
+def _open_list(data, filter_condition):
+    if data and (type(data[0]) is str or type(data[0]) in _NUMERIC_TYPES):
+        element_types = set(map(type, data))
+        if element_types <= _NUMERIC_TYPES:
+            # nothing to filter, copy without walking elements one by one
+            return iter(()), list(data)
+        elif element_types == {str}:
+            # flat list of strings, filter in one comprehension over C-level maps
+            return (
+                iter(()),
+                [
+                    element
+                    for element in map(str.lower, map(str.strip, data))
+                    if element != filter_condition
+                ],
+            )
+
+    return zip(itertools.repeat(None), data), []
+
+
+def _open_set(data, filter_condition):
+    return zip(itertools.repeat(None), data), set()
+
+
+_FILTER_HANDLERS = dict.fromkeys(_PASSTHROUGH_TYPES, _filter_leaf)
+_FILTER_HANDLERS[str] = _filter_str
+
+# tuple items are collected in a list and converted when the tuple is finished
+_FILTER_CONTAINERS = {
+    dict: _open_dict,
+    list: _open_list,
+    tuple: _open_list,
+    set: _open_set,
+}
+
+
+def _get_filter_type(value_type):
+    """ get the type registered in filter handlers for value_type, subclasses included
+    """
+    for base_type in value_type.__mro__:
+        if base_type in _FILTER_HANDLERS or base_type in _FILTER_CONTAINERS:
+            return base_type
+
+    return None
+
+
+def _filter_container(data, filter_condition: Text):
+    """ remove strings equal to filter_condition from nested dict/list/tuple/set data.
+
+    The nested data is walked iteratively with an explicit stack instead of recursion,
+    each stack frame is (items iterator, container type, result, parent frame, key).
+
+    """
+    # string values are stripped and lowered before comparing, so is the condition
+    filter_condition = filter_condition.strip().lower()
+
+    # bind lookups used in the hot loop to locals
+    get_handler = _FILTER_HANDLERS.get
+    passthrough_types = _PASSTHROUGH_TYPES
+    containers = _FILTER_CONTAINERS
+
+    container_type = _get_filter_type(type(data))
+    items, result = containers[container_type](data, filter_condition)
+    stack = [(items, container_type, result, None, None)]
+
+    while stack:
+        frame = stack[-1]
+        items, container_type, result, parent_frame, parent_key = frame
+
+        for key, value in items:
+            value_type = type(value)
+            if value_type is str:
+                # fast path for the most common leaf type
+                value = value.strip().lower()
+                if value == filter_condition:
+                    continue
+            elif value_type not in passthrough_types:
+                handler = get_handler(value_type)
+                if handler is None:
+                    if value_type not in containers:
+                        value_type = _get_filter_type(value_type)
+                        if value_type is None:
+                            raise TypeError("no this type {}".format(value))
+
+                        handler = get_handler(value_type)
+
+                if handler is None:
+                    if container_type is set:
+                        raise TypeError(
+                            "set no daughter elements for dict/list/set/tuple: {}".format(
+                                value
+                            )
+                        )
+
+                    # descend into nested container, resume current one when it's done
+                    child_items, child_result = containers[value_type](
+                        value, filter_condition
+                    )
+                    stack.append((child_items, value_type, child_result, frame, key))
+                    break
+
+                value = handler(value, filter_condition)
+                if value is _FILTERED:
+                    continue
+
+            if container_type is dict:
+                result[key] = value
+            elif container_type is set:
+                result.add(value)
+            else:
+                result.append(value)
+
+        else:
+            stack.pop()
+            if container_type is tuple:
+                result = tuple(result)
+
+            if parent_frame is None:
+                return result
+
+            parent_type, parent_result = parent_frame[1], parent_frame[2]
+            if parent_type is dict:
+                parent_result[parent_key] = result
+            elif parent_type is list and container_type is list:
+                # nested list is flattened into its parent list
+                parent_result.extend(result)
+            else:
+                parent_result.append(result)
+
+
+def filter_dict(data: Dict, filter_condition="@null@") -> Dict:
+    if data is None:
+        return data
+
+    if not isinstance(filter_condition, str) or not isinstance(data, dict):
+        raise TypeError(
+            "filter_condition must str and data will be dict for the method filter_dict"
+        )
+
+    return _filter_container(data, filter_condition)
+
+
+def filter_list(data: List, filter_condition="@null@") -> List:
+    if data is None:
+        return data
+
+    if not isinstance(filter_condition, str) or not isinstance(data, list):
+        raise TypeError(
+            "filter_condition must str and data will be list for the method filter_list"
+        )
+
+    return _filter_container(data, filter_condition)
 
 
 def filter_tuple(data: tuple, filter_condition="@null@") -> tuple:
-	if data is None:
-		return data
-	result_data = tuple()
-	if not isinstance(filter_condition, str) or not isinstance(data, tuple):
-		raise TypeError('filter_condition must str and data will be tuple for the method filter_tuple')
-
-	for element in data:
-		if isinstance(element, (int, float, complex, bool)):
-			result_data = result_data + (element,)
-		elif isinstance(element, str):
-			element = element.strip().lower()
-			if element == filter_condition:
-				continue
-			else:
-				result_data = result_data + (element,)
-		elif isinstance(element, dict):
-			result_data = result_data + (filter_dict(element, filter_condition=filter_condition),)
-		elif isinstance(element, list):
-			result_data = result_data + (filter_list(element, filter_condition=filter_condition),)
-		elif isinstance(element, tuple):
-			result_data = result_data + (filter_tuple(element, filter_condition=filter_condition),)
-		elif isinstance(element, set):
-			result_data = result_data + (filter_set(element, filter_condition=filter_condition),)
-		elif element is None:
-			result_data = result_data + (element,)
-		else:
-			raise TypeError("no this type {}".format(element))
-	return result_data
-
-
-def filter_set(data: set, filter_condition='@null@') -> set:
-	if data is None:
-		return data
-	result_data = set()
-	if not isinstance(filter_condition, str) or not isinstance(data, set):
-		raise TypeError('filter_condition must str and data will be set for the method filter_set')
-
-	for element in data:
-		if isinstance(element, (int, float, complex, bool)):
-			result_data.add(element)
-		elif isinstance(element, str):
-			element = element.strip().lower()
-			if element == filter_condition:
-				continue
-			else:
-				result_data.add(element)
-		elif isinstance(element, (dict, list, set, tuple)):
-			raise TypeError("set no daughter elements for dict/list/set/tuple: {}".format(element))
-		elif element is None:
-			result_data.add(element)
-		else:
-			raise TypeError("no this type {}".format(element))
-	return result_data
+    if data is None:
+        return data
+
+    if not isinstance(filter_condition, str) or not isinstance(data, tuple):
+        raise TypeError(
+            "filter_condition must str and data will be tuple for the method filter_tuple"
+        )
+
+    return _filter_container(data, filter_condition)
+
+
+def filter_set(data: set, filter_condition="@null@") -> set:
+    if data is None:
+        return data
+
+    if not isinstance(filter_condition, str) or not isinstance(data, set):
+        raise TypeError(
+            "filter_condition must str and data will be set for the method filter_set"
+        )
+
+    return _filter_container(data, filter_condition)
@@ -2,7 +2,7 @@ import os
 import time
 import unittest
 
-from httprunner import parser
+from httprunner import parser, exceptions
 from httprunner.exceptions import VariableNotFound, FunctionNotFound
 from httprunner.loader import load_project_meta
 
@@ -545,3 +545,37 @@ class TestParserBasic(unittest.TestCase):
             },
             parsed_params,
         )
+
+    def test_parse_parameters_sampling(self):
+        parameters = {
+            "user_agent": ["iOS/10.1", "iOS/10.2", "iOS/10.3"],
+            "username-password": [["user1", "111111"], ["user2", "222222"]],
+            "app_version": ["2.8.5", "2.8.6"],
+        }
+        self.assertEqual(len(parser.parse_parameters(parameters)), 3 * 2 * 2)
+
+        parsed_params = parser.parse_parameters(parameters, sampling="each-value")
+        self.assertEqual(len(parsed_params), 3)
+        self.assertEqual(
+            parsed_params[2],
+            {
+                "user_agent": "iOS/10.3",
+                "username": "user1",
+                "password": "111111",
+                "app_version": "2.8.5",
+            },
+        )
+
+        parsed_params = parser.parse_parameters(parameters, sampling="pairwise")
+        self.assertLess(len(parsed_params), 3 * 2 * 2)
+        self.assertEqual(
+            {(p["user_agent"], p["app_version"]) for p in parsed_params},
+            {
+                (user_agent, app_version)
+                for user_agent in parameters["user_agent"]
+                for app_version in parameters["app_version"]
+            },
+        )
+
+        with self.assertRaises(exceptions.ParamsError):
+            parser.parse_parameters(parameters, sampling="random")
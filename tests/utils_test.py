@@ -85,6 +85,9 @@ class TestUtils(unittest.TestCase):
         self.assertIn("Accept", new_request_dict["headers"])
         self.assertIn("User-Agent", new_request_dict["headers"])
 
+        request_dict = {"url": "http://127.0.0.1:5000", "method": "POST"}
+        self.assertIs(utils.lower_dict_keys(request_dict), request_dict)
+
         request_dict = "$default_request"
         new_request_dict = utils.lower_dict_keys(request_dict)
         self.assertEqual("$default_request", request_dict)
@@ -97,6 +100,17 @@ class TestUtils(unittest.TestCase):
         info_mapping = {"a": 1, "t": (1, 2), "b": {"b1": 123}, "c": None, "d": [4, 5]}
         utils.print_info(info_mapping)
 
+    def test_omit_long_data(self):
+        self.assertEqual(utils.omit_long_data("abc", omit_len=5), "abc")
+        self.assertEqual(
+            utils.omit_long_data("a" * 10, omit_len=5),
+            "aaaaa ... OMITTED 5 CHARACTERS ...",
+        )
+        self.assertEqual(
+            utils.omit_long_data(b"a" * 10, omit_len=5),
+            b"aaaaa ... OMITTED 5 CHARACTERS ...",
+        )
+
     def test_sort_dict_by_custom_order(self):
         self.assertEqual(
             list(
@@ -118,6 +132,10 @@ class TestUtils(unittest.TestCase):
 
         json.dumps(data, cls=ExtendJSONEncoder)
 
+        self.assertEqual(
+            json.dumps({"c": b"abc"}, cls=ExtendJSONEncoder), '{"c": "b\'abc\'"}'
+        )
+
     def test_override_config_variables(self):
         step_variables = {"base_url": "$base_url", "foo1": "bar1"}
         config_variables = {"base_url": "https://httpbin.org", "foo1": "bar111"}
@@ -152,6 +170,42 @@ class TestUtils(unittest.TestCase):
         product_list = utils.gen_cartesian_product(*parameters_content_list)
         self.assertEqual(product_list, [])
 
+    def test_cartesian_product_iter(self):
+        parameters_content_list = [
+            [{"a": 1}, {"a": 2}],
+            [{"x": 111, "y": 112}, {"x": 121, "y": 122}],
+        ]
+        product_iter = utils.gen_cartesian_product_iter(*parameters_content_list)
+        self.assertEqual(next(product_iter), {"a": 1, "x": 111, "y": 112})
+        self.assertEqual(len(list(product_iter)), 3)
+
+    def test_each_value_product(self):
+        parameters_content_list = [
+            [{"a": 1}, {"a": 2}],
+            [{"x": 111}, {"x": 121}, {"x": 131}],
+        ]
+        product_list = utils.gen_each_value_product(*parameters_content_list)
+        self.assertEqual(
+            product_list,
+            [{"a": 1, "x": 111}, {"a": 2, "x": 121}, {"a": 1, "x": 131}],
+        )
+
+    def test_pairwise_product(self):
+        parameters_content_list = [
+            [{"a": 1}, {"a": 2}, {"a": 3}],
+            [{"b": 1}, {"b": 2}, {"b": 3}],
+            [{"c": 1}, {"c": 2}],
+            [{"d": 1}, {"d": 2}],
+        ]
+        product_list = utils.gen_pairwise_product(*parameters_content_list)
+        self.assertLess(len(product_list), 3 * 3 * 2 * 2)
+        for key1, key2 in [("a", "b"), ("a", "d"), ("b", "c"), ("c", "d")]:
+            self.assertEqual(
+                len({(item[key1], item[key2]) for item in product_list}),
+                len({item[key1] for item in product_list})
+                * len({item[key2] for item in product_list}),
+            )
+
     def test_filter_set(self):
         parameters_content_set = set()
         product_set = utils.filter_set(parameters_content_set, filter_condition='@null@')
@@ -162,6 +216,15 @@ class TestUtils(unittest.TestCase):
         product_tuple = utils.filter_tuple(parameters_content_tuple, filter_condition='@null@')
         self.assertEqual(product_tuple, ())
 
+    def test_filter_tuple_elements(self):
+        data = (1, " A ", "@null@", None, [2, "@null@"], ({"b": "@null@"},))
+        self.assertEqual(
+            utils.filter_tuple(data), (1, "a", None, [2], ({},)),
+        )
+
+        data = tuple(["x", "@null@"] * 10000)
+        self.assertEqual(utils.filter_tuple(data), ("x",) * 10000)
+
     def test_filter_list(self):
         parameters_content_list = []
         product_list = utils.filter_list(parameters_content_list, filter_condition='@null@')
@@ -170,4 +233,38 @@ class TestUtils(unittest.TestCase):
     def test_filter_dict(self):
         parameters_content_dict = {}
         product_dict = utils.filter_dict(parameters_content_dict, filter_condition='@null@')
-        self.assertEqual(product_dict, {})
\ No newline at end of file
+        self.assertEqual(product_dict, {})
+
+    def test_filter_dict_nested(self):
+        data = {
+            "a": " @NULL@ ",
+            "b": ["@null@", "Foo", [1, "@null@"]],
+            "c": ({"d": "@null@", "e": None}, 2.5),
+            "f": {"g", "@null@"},
+        }
+        self.assertEqual(
+            utils.filter_dict(data),
+            {"b": ["foo", 1], "c": ({"e": None}, 2.5), "f": {"g"}},
+        )
+
+    def test_filter_condition_normalized(self):
+        self.assertEqual(
+            utils.filter_list(["@null@", " A "], filter_condition=" @NULL@"), ["a"]
+        )
+
+    def test_filter_list_deeply_nested(self):
+        data = ["@null@"]
+        for _ in range(10000):
+            data = [{"a": data}]
+
+        result = utils.filter_list(data)
+        for _ in range(10000):
+            result = result[0]["a"]
+        self.assertEqual(result, [])
+
+    def test_filter_list_numeric(self):
+        data = [1, 2.5, True, 3j]
+        result = utils.filter_list(data)
+        self.assertEqual(result, data)
+        self.assertIsNot(result, data)
+        self.assertEqual(utils.filter_tuple((1, 2)), (1, 2))